@@ -1,5 +1,5 @@
 """
-Hash Table with Chaining Implementation
+Hash Table with Open Addressing Implementation
 Author: Mausam Shrestha
 Assignment: 3
 Course: CS 532
@@ -7,102 +7,345 @@ Course: CS 532
 
 import random
 import time
-import math
-from typing import List, Optional, Tuple, Any
+from typing import List, Literal, Optional, Tuple, Any
 import numpy as np
+from llvmlite import ir
+from numba import njit, types
+from numba.core import cgutils
+from numba.extending import intrinsic
 
 
-class HashNode:
-    """Node for the linked list in chaining."""
+# Control byte values: a full slot stores 0x80 | (7 bits of its hash)
+EMPTY = 0x00
+TOMBSTONE = 0x01
+
+# The same control bytes as bytes objects, for scanning a group with bytes.find
+EMPTY_BYTE = bytes((EMPTY,))
+TOMBSTONE_BYTE = bytes((TOMBSTONE,))
+
+# Number of control bytes compared at once while probing
+GROUP_WIDTH = 16
+
+# Probe sequences are linear for this many slots (two groups), then triangular
+LINEAR_PROBE_LIMIT = 32
+
+# Hash values are computed modulo 2^64
+MASK64 = 2 ** 64 - 1
+
+# Range of keys an 'int' table can store
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# Batch kernels prefetch the home slot of the key this many positions ahead,
+# once the table has enough slots (256 KB of keys) to spill out of L2 cache
+PREFETCH_DISTANCE = 8
+PREFETCH_MIN_SIZE = 1 << 15
+
+
+@intrinsic
+def _prefetch(typingctx, arr, index):
+    """Hint the CPU to start loading arr[index] into cache (emits llvm.prefetch)."""
+    def codegen(context, builder, signature, args):
+        arr_type = signature.args[0]
+        array = context.make_array(arr_type)(context, builder, args[0])
+        pointer = cgutils.get_item_pointer(context, builder, arr_type, array, [args[1]])
+        i32 = ir.IntType(32)
+        function_type = ir.FunctionType(ir.VoidType(), [cgutils.voidptr_t, i32, i32, i32])
+        function = cgutils.get_or_insert_function(builder.module, function_type, "llvm.prefetch")
+        # Read access, keep in all cache levels, data cache
+        builder.call(function, [builder.bitcast(pointer, cgutils.voidptr_t), i32(0), i32(3), i32(1)])
+        return context.get_dummy_value()
+    return types.void(arr, index), codegen
+
+
+@njit(cache=True)
+def _split_hash_int(params, key):
+    """Hash an int64 key as (a * k) mod 2^64 and split it like UniversalHashTable._split_hash."""
+    a = params[0]
+    shift = params[1]
+    # uint64 multiplication wraps, which is exactly the mod 2^64 of the hash
+    hash_value = np.uint64(key) * a
+    index = np.int64(hash_value >> shift)
+    tag = np.int64((hash_value >> (shift - np.uint64(7))) & np.uint64(0x7F)) | 0x80
+    return index, tag
+
+
+@njit(cache=True)
+def _probe_step(index, depth, mask):
+    """
+    Advance to the next slot of a probe sequence once `depth` slots have been examined.
+    
+    The first LINEAR_PROBE_LIMIT slots are consecutive, which keeps short
+    probes cache friendly; after that the step grows by one each time
+    (triangular numbers), which escapes long clusters of sequential keys
+    and still visits every slot of a power-of-two table.
+    
+    The interpreted probe loops inline the same arithmetic, since calling
+    a compiled function from Python costs more than the step itself.
+    """
+    if depth < LINEAR_PROBE_LIMIT:
+        return (index + 1) & mask
+    return (index + depth - LINEAR_PROBE_LIMIT + 1) & mask
+
+
+@njit(cache=True)
+def _prefetch_home_int(ctrl, keys, params, key):
+    """
+    Start loading the home slot of an int64 key before it is probed.
+    
+    A lone probe stalls on its first cache miss once the table outgrows
+    the L2 cache; issuing the loads for a key several positions ahead in a
+    batch lets those misses overlap with the work on the current key.
+    """
+    index, _ = _split_hash_int(params, key)
+    _prefetch(ctrl, index)
+    _prefetch(keys, index)
+
+
+@njit(cache=True)
+def _probe_int(ctrl, keys, params, key):
+    """
+    Look up an int64 key along its probe sequence.
+    
+    Returns:
+        Index of the slot holding the key, or -1 if the key is absent
+    """
+    mask = len(ctrl) - 1
+    index, tag = _split_hash_int(params, key)
+    
+    depth = 0
+    while True:
+        c = ctrl[index]
+        if c == tag and keys[index] == key:
+            return index
+        if c == EMPTY:
+            return -1
+        depth += 1
+        index = _probe_step(index, depth, mask)
+
+
+@njit(cache=True)
+def _insert_int(ctrl, keys, params, key):
+    """
+    Claim the slot for an int64 key, writing its control byte and key.
+    
+    Returns:
+        Tuple of (slot index, home index, previous control byte of the slot)
+    """
+    mask = len(ctrl) - 1
+    home_index, tag = _split_hash_int(params, key)
     
-    def __init__(self, key: Any, value: Any):
-        self.key = key
-        self.value = value
-        self.next = None
+    index = home_index
+    free_index = -1
+    depth = 0
+    while True:
+        c = ctrl[index]
+        if c == tag and keys[index] == key:
+            return index, home_index, c
+        if c < 0x80 and free_index < 0:
+            free_index = index
+        if c == EMPTY:
+            break
+        depth += 1
+        index = _probe_step(index, depth, mask)
+    
+    previous = ctrl[free_index]
+    ctrl[free_index] = tag
+    keys[free_index] = key
+    return free_index, home_index, previous
+
+
+@njit(cache=True)
+def _rehash_int(ctrl, keys, params, old_keys):
+    """
+    Place distinct int64 keys into a freshly allocated table.
+    
+    Returns:
+        Slot index per key
+    """
+    mask = len(ctrl) - 1
+    slots = np.empty(len(old_keys), dtype=np.int64)
+    prefetch = len(ctrl) >= PREFETCH_MIN_SIZE
+    for j in range(len(old_keys)):
+        if prefetch and j + PREFETCH_DISTANCE < len(old_keys):
+            _prefetch_home_int(ctrl, keys, params, old_keys[j + PREFETCH_DISTANCE])
+        index, tag = _split_hash_int(params, old_keys[j])
+        # No tombstones or duplicates yet, so the first empty slot is the one
+        depth = 0
+        while ctrl[index] != EMPTY:
+            depth += 1
+            index = _probe_step(index, depth, mask)
+        ctrl[index] = tag
+        keys[index] = old_keys[j]
+        slots[j] = index
+    return slots
+
+
+@njit(cache=True)
+def _bulk_insert_int(ctrl, keys, params, batch):
+    """
+    Claim slots for a batch of int64 keys; the table must already have room for all of them.
+    
+    Returns:
+        Tuple of (slot per key, new keys, reused tombstones, collisions)
+    """
+    slots = np.empty(len(batch), dtype=np.int64)
+    prefetch = len(ctrl) >= PREFETCH_MIN_SIZE
+    inserted = 0
+    reused = 0
+    collisions = 0
+    for j in range(len(batch)):
+        if prefetch and j + PREFETCH_DISTANCE < len(batch):
+            _prefetch_home_int(ctrl, keys, params, batch[j + PREFETCH_DISTANCE])
+        index, home_index, previous = _insert_int(ctrl, keys, params, batch[j])
+        slots[j] = index
+        if previous < 0x80:
+            inserted += 1
+            if previous == TOMBSTONE:
+                reused += 1
+            if index != home_index:
+                collisions += 1
+    return slots, inserted, reused, collisions
+
+
+@njit(cache=True)
+def _bulk_probe_int(ctrl, keys, params, batch):
+    """Look up a batch of int64 keys, returning the slot per key (-1 if absent)."""
+    slots = np.empty(len(batch), dtype=np.int64)
+    prefetch = len(ctrl) >= PREFETCH_MIN_SIZE
+    for j in range(len(batch)):
+        if prefetch and j + PREFETCH_DISTANCE < len(batch):
+            _prefetch_home_int(ctrl, keys, params, batch[j + PREFETCH_DISTANCE])
+        slots[j] = _probe_int(ctrl, keys, params, batch[j])
+    return slots
+
+
+@njit(cache=True)
+def _bulk_delete_int(ctrl, keys, params, batch):
+    """Tombstone a batch of int64 keys, returning the freed slot per key (-1 if absent)."""
+    slots = np.empty(len(batch), dtype=np.int64)
+    prefetch = len(ctrl) >= PREFETCH_MIN_SIZE
+    for j in range(len(batch)):
+        if prefetch and j + PREFETCH_DISTANCE < len(batch):
+            _prefetch_home_int(ctrl, keys, params, batch[j + PREFETCH_DISTANCE])
+        index = _probe_int(ctrl, keys, params, batch[j])
+        if index >= 0:
+            ctrl[index] = TOMBSTONE
+        slots[j] = index
+    return slots
 
 
 class UniversalHashTable:
     """
-    Hash table implementation using chaining for collision resolution.
-    Uses universal hashing to minimize collisions.
+    Hash table implementation using open addressing, probing linearly
+    for the first LINEAR_PROBE_LIMIT slots and triangularly after that.
+    Keys and values live in two parallel numpy arrays (structure of arrays),
+    and universal (multiply-shift) hashing is used to minimize collisions.
+    
+    A third array holds one control byte per slot (Swiss-table style), so a
+    probe compares a whole group of 16 bytes with one vectorized operation
+    and only loads keys whose 7-bit hash tag matches.
+    
+    The table is specialized to one kind of key when it is created: 'int'
+    tables store unboxed int64 keys and run every probe in compiled code,
+    while 'str' and 'other' tables store Python objects along with each
+    key's full 64-bit hash, so a resize never calls hash() again and a probe
+    only compares keys whose stored hash matches. Values are stored
+    as Python objects unless a numeric value_dtype is given.
+    
+    Each call into a compiled kernel costs a few hundred nanoseconds of
+    dispatch, so the compiled 'int' path pays off through bulk_insert,
+    bulk_search and bulk_delete, which handle a whole batch per call; a
+    single insert, search or delete is no faster than pure Python.
     """
     
-    def __init__(self, initial_size: int = 11):
+    def __init__(self, initial_size: int = 16, key_kind: Literal['int', 'str', 'other'] = 'other',
+                 value_dtype: Any = object):
         """
-        Initialize hash table with chaining.
+        Initialize hash table with open addressing.
         
         Args:
-            initial_size: Initial size of the hash table (should be prime)
+            initial_size: Initial size of the hash table (rounded up to a power of two, at least 16)
+            key_kind: Kind of keys the table will hold ('int', 'str' or 'other')
+            value_dtype: numpy dtype of the value array; switched to object if a value does not fit it
         """
-        self.size = initial_size
+        self.size = max(GROUP_WIDTH, 1 << (initial_size - 1).bit_length())
         self.count = 0
-        self.table: List[Optional[HashNode]] = [None] * self.size
+        self._tombstones = 0
+        
+        # Bind the hash function for the key kind once, instead of
+        # dispatching on the key type for every operation ('int' tables
+        # hash inside the compiled kernels, with _split_hash_int)
+        if key_kind == 'str':
+            self._hash = self._hash_str
+        elif key_kind == 'other':
+            self._hash = self._hash_other
+        elif key_kind != 'int':
+            raise ValueError(f"Unknown key kind: {key_kind}")
+        self.key_kind = key_kind
+        self._int_keys = key_kind == 'int'
+        
+        self._ctrl = np.full(self.size, EMPTY, dtype=np.uint8)
+        self._keys = np.zeros(self.size, dtype=np.int64 if self._int_keys else object)
+        self._vals = np.empty(self.size, dtype=value_dtype)
+        # Int keys rehash with one multiply and compare as int64, so only object keys keep their hash
+        self._hashes = None if self._int_keys else np.zeros(self.size, dtype=np.uint64)
         
         # Universal hash function parameters
-        # h(k) = ((a * k + b) mod p) mod m
-        # where p is a large prime > max key, a ∈ [1, p-1], b ∈ [0, p-1]
-        self.p = self._find_next_prime(2 * self.size)  # p > m
-        self.a = random.randint(1, self.p - 1)
-        self.b = random.randint(0, self.p - 1)
+        # h(k) = (a * k) mod 2^64, home slot = top log2(m) bits of h
+        # where a is a random odd 64-bit multiplier, kept for the table's
+        # lifetime so stored hashes stay valid across resizes
+        self.a = random.getrandbits(64) | 1
+        self._shift = 64 - self.size.bit_length() + 1
+        self._update_params()
         
-        # Performance counters
+        # Performance counters (only updated once enable_stats() is called)
+        self._stats_enabled = False
         self.access_count = 0
         self.collision_count = 0
     
-    def _find_next_prime(self, n: int) -> int:
-        """Find the next prime number greater than or equal to n."""
-        if n <= 2:
-            return 2
-        
-        # Make sure n is odd
-        if n % 2 == 0:
-            n += 1
-        
-        while not self._is_prime(n):
-            n += 2
-        
-        return n
+    def _update_params(self):
+        """Pack the hash parameters into the uint64 buffer read by the compiled kernels."""
+        self._params = np.array([self.a, self._shift], dtype=np.uint64)
     
-    def _is_prime(self, n: int) -> bool:
-        """Check if a number is prime."""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
-        
-        return True
+    def enable_stats(self):
+        """Start counting accesses and collisions; off by default to keep them out of every operation."""
+        self._stats_enabled = True
+    
+    def _hash_str(self, key: str) -> int:
+        """Universal hash function for string keys (strings cache their built-in hash)."""
+        return (self.a * hash(key)) & MASK64
     
-    def _hash(self, key: Any) -> int:
+    def _hash_other(self, key: Any) -> int:
         """
-        Universal hash function.
+        Universal hash function for keys of any type.
         
         Args:
             key: The key to hash
             
         Returns:
-            Hash index
+            Full 64-bit hash value
         """
         # Convert key to integer if it's not already
-        if isinstance(key, str):
-            key_int = sum(ord(c) for c in key)
-        elif isinstance(key, (int, float)):
+        if isinstance(key, (int, float, np.integer)):
             key_int = int(key)
         else:
             key_int = hash(key)
         
-        # Ensure key is positive
-        key_int = abs(key_int)
-        
-        # Universal hash function: ((a * k + b) mod p) mod m
-        hash_value = ((self.a * key_int + self.b) % self.p) % self.size
+        # Universal hash function: (a * k) mod 2^64
+        return (self.a * key_int) & MASK64
+    
+    def _split_hash(self, hash_value: int) -> Tuple[int, int]:
+        """
+        Split a hash value into its home slot (top bits) and control tag (the next 7 bits).
         
-        return hash_value
+        Args:
+            hash_value: Full 64-bit hash of a key
+            
+        Returns:
+            Tuple of (home index, control byte)
+        """
+        return hash_value >> self._shift, ((hash_value >> (self._shift - 7)) & 0x7F) | 0x80
     
     def _get_load_factor(self) -> float:
         """Calculate the current load factor."""
@@ -115,25 +358,288 @@ class UniversalHashTable:
         Args:
             new_size: New size for the hash table
         """
-        old_table = self.table
-        old_size = self.size
+        old_ctrl = self._ctrl
+        old_keys = self._keys
+        old_vals = self._vals
+        old_hashes = self._hashes
         
-        # Create new table
+        # Create new table (tombstones are dropped while rehashing)
         self.size = new_size
-        self.table = [None] * self.size
-        self.count = 0
+        self._shift = 64 - self.size.bit_length() + 1
+        self._ctrl = np.full(self.size, EMPTY, dtype=np.uint8)
+        self._keys = np.zeros(self.size, dtype=old_keys.dtype)
+        self._vals = np.empty(self.size, dtype=old_vals.dtype)
+        if old_hashes is not None:
+            self._hashes = np.zeros(self.size, dtype=np.uint64)
+        self._tombstones = 0
         
-        # Update hash function parameters
-        self.p = self._find_next_prime(2 * self.size)
-        self.a = random.randint(1, self.p - 1)
-        self.b = random.randint(0, self.p - 1)
+        # Only the shift depends on the size; the multiplier is unchanged
+        self._update_params()
         
         # Rehash all elements
-        for i in range(old_size):
-            current = old_table[i]
-            while current is not None:
-                self.insert(current.key, current.value)
-                current = current.next
+        self._rehash_from(old_ctrl, old_keys, old_vals, old_hashes)
+    
+    def _rehash_from(self, old_ctrl: np.ndarray, old_keys: np.ndarray, old_vals: np.ndarray,
+                     old_hashes: Optional[np.ndarray]):
+        """
+        Move every live entry of the old arrays into the (empty) current table.
+        
+        Skips insert entirely: keys are known to be distinct and the new table
+        has no tombstones, so each key goes to the first empty slot of its
+        probe sequence and the load factor and counters need no checks.
+        Object keys are placed from their stored hashes without rehashing.
+        
+        Args:
+            old_ctrl: Control bytes of the old table
+            old_keys: Keys of the old table
+            old_vals: Values of the old table
+            old_hashes: Stored hashes of the old table (None for int keys)
+        """
+        occupied = np.flatnonzero(old_ctrl & 0x80)
+        
+        if self._int_keys:
+            slots = _rehash_int(self._ctrl, self._keys, self._params, old_keys[occupied])
+        else:
+            slots = np.empty(len(occupied), dtype=np.int64)
+            mask = self.size - 1
+            for j, hash_value in enumerate(old_hashes[occupied].tolist()):
+                index, tag = self._split_hash(hash_value)
+                depth = 0
+                while self._ctrl[index] != EMPTY:
+                    # Same step as _probe_step
+                    depth += 1
+                    if depth < LINEAR_PROBE_LIMIT:
+                        index = (index + 1) & mask
+                    else:
+                        index = (index + depth - LINEAR_PROBE_LIMIT + 1) & mask
+                self._ctrl[index] = tag
+                slots[j] = index
+            self._keys[slots] = old_keys[occupied]
+            self._hashes[slots] = old_hashes[occupied]
+        
+        self._vals[slots] = old_vals[occupied]
+        self.count = len(occupied)
+    
+    def _check_int_key(self, key: Any) -> int:
+        """
+        Validate a key for an 'int' table before it reaches the compiled kernels.
+        
+        Args:
+            key: The key to check
+            
+        Returns:
+            The key as a Python int
+            
+        Raises:
+            TypeError: If the key is not an integer
+            OverflowError: If the key does not fit in int64
+        """
+        if type(key) is not int and not isinstance(key, np.integer):
+            raise TypeError(f"'int' hash table keys must be integers, not {type(key).__name__}")
+        key = int(key)
+        if not INT64_MIN <= key <= INT64_MAX:
+            raise OverflowError(f"Key {key} does not fit in int64")
+        return key
+    
+    def _check_int_keys(self, keys: Any) -> np.ndarray:
+        """
+        Validate a batch of keys for an 'int' table without casting them.
+        
+        Args:
+            keys: Array of keys to check
+            
+        Returns:
+            The keys as an int64 array
+            
+        Raises:
+            TypeError: If the array does not hold integers
+            OverflowError: If a key does not fit in int64
+        """
+        keys = np.asarray(keys)
+        if keys.size == 0:
+            return np.empty(0, dtype=np.int64)
+        if keys.dtype.kind not in 'iu':
+            raise TypeError(f"'int' hash table keys must be integers, not {keys.dtype}")
+        if keys.dtype == np.uint64 and keys.max() > INT64_MAX:
+            raise OverflowError("Keys do not fit in int64")
+        return keys.astype(np.int64, copy=False)
+    
+    def _find_slot(self, key: Any) -> int:
+        """
+        Probe from the key's home slot, group by group while probing linearly.
+        
+        Args:
+            key: The key to look up
+            
+        Returns:
+            Index of the slot holding the key, or -1 if the key is absent
+        """
+        if self._int_keys:
+            return _probe_int(self._ctrl, self._keys, self._params, self._check_int_key(key))
+        
+        hash_value = self._hash(key)
+        index, tag = self._split_hash(hash_value)
+        
+        # Fast path: most lookups end at the home slot, on an empty slot or
+        # on the key itself, without scanning a group
+        ctrl = self._ctrl[index]
+        if ctrl == EMPTY:
+            return -1
+        if ctrl == tag and self._hashes[index] == hash_value and self._keys[index] == key:
+            return index
+        
+        # Linear phase: scan a whole group of control bytes at once (as bytes,
+        # which is far cheaper than numpy calls on a 16-byte slice); a key is
+        # only compared once its tag and full stored hash match
+        mask = self.size - 1
+        tag_byte = bytes((tag,))
+        depth = 1
+        index = (index + 1) & mask
+        while depth < LINEAR_PROBE_LIMIT:
+            group = self._ctrl[index:index + min(GROUP_WIDTH, LINEAR_PROBE_LIMIT - depth)].tobytes()
+            # An empty slot ends every probe sequence that reaches it
+            end = group.find(EMPTY_BYTE)
+            limit = len(group) if end < 0 else end
+            i = group.find(tag_byte, 0, limit)
+            while i >= 0:
+                if self._hashes[index + i] == hash_value and self._keys[index + i] == key:
+                    return index + i
+                i = group.find(tag_byte, i + 1, limit)
+            if end >= 0:
+                return -1
+            depth += len(group)
+            index = (index + len(group)) & mask
+        
+        # Triangular phase: one slot at a time
+        while True:
+            ctrl = self._ctrl[index]
+            if ctrl == tag and self._hashes[index] == hash_value and self._keys[index] == key:
+                return index
+            if ctrl == EMPTY:
+                return -1
+            # Past the linear phase, so this is _probe_step's triangular step
+            depth += 1
+            index = (index + depth - LINEAR_PROBE_LIMIT + 1) & mask
+    
+    def _insert_slot(self, key: Any) -> Tuple[int, int, int]:
+        """
+        Claim the slot for a key, writing its control byte and key.
+        
+        Args:
+            key: The key being inserted
+            
+        Returns:
+            Tuple of (slot index, home index, previous control byte of the slot)
+        """
+        hash_value = self._hash(key)
+        home_index, tag = self._split_hash(hash_value)
+        
+        # Walk the probe sequence until the key or an empty slot is found,
+        # remembering the first free (empty or deleted) slot so it can be
+        # reused; the home slot is checked on its own first, since most
+        # probes end there
+        index = home_index
+        ctrl = self._ctrl[index]
+        if ctrl == tag and self._hashes[index] == hash_value and self._keys[index] == key:
+            return index, home_index, tag
+        free_index = index if ctrl < 0x80 else -1
+        
+        if ctrl != EMPTY:
+            mask = self.size - 1
+            tag_byte = bytes((tag,))
+            depth = 1
+            index = (index + 1) & mask
+            while depth < LINEAR_PROBE_LIMIT:
+                group = self._ctrl[index:index + min(GROUP_WIDTH, LINEAR_PROBE_LIMIT - depth)].tobytes()
+                end = group.find(EMPTY_BYTE)
+                limit = len(group) if end < 0 else end
+                i = group.find(tag_byte, 0, limit)
+                while i >= 0:
+                    if self._hashes[index + i] == hash_value and self._keys[index + i] == key:
+                        return index + i, home_index, tag
+                    i = group.find(tag_byte, i + 1, limit)
+                if free_index < 0:
+                    free = group.find(TOMBSTONE_BYTE, 0, limit)
+                    if free < 0:
+                        free = end
+                    if free >= 0:
+                        free_index = index + free
+                if end >= 0:
+                    break
+                depth += len(group)
+                index = (index + len(group)) & mask
+            else:
+                while True:
+                    ctrl = self._ctrl[index]
+                    if ctrl == tag and self._hashes[index] == hash_value and self._keys[index] == key:
+                        return index, home_index, tag
+                    if ctrl < 0x80 and free_index < 0:
+                        free_index = index
+                    if ctrl == EMPTY:
+                        break
+                    depth += 1
+                    index = (index + depth - LINEAR_PROBE_LIMIT + 1) & mask
+        
+        previous = self._ctrl[free_index]
+        self._ctrl[free_index] = tag
+        self._keys[free_index] = key
+        self._hashes[free_index] = hash_value
+        return free_index, home_index, previous
+    
+    def _prepare_values(self, values: Any, count: Optional[int] = None) -> Any:
+        """
+        Get values ready to be written into their slots, before any slot is claimed.
+        
+        A typed value array is converted to object dtype the first time a
+        value cannot be stored in it exactly (a string, a float in an int64
+        table, an int beyond 64 bits), rather than truncating or rejecting it.
+        Doing this up front means the write after the probe cannot fail and
+        leave a claimed slot without its value.
+        
+        Args:
+            values: A single value, or a sequence of values
+            count: Number of values expected, or None for a single value
+            
+        Returns:
+            Values that can be assigned to the slots as they are
+        """
+        if count is not None and len(values) != count:
+            raise ValueError(f"Expected {count} values, got {len(values)}")
+        
+        # Only a typed value array needs the values converted to check them
+        if self._vals.dtype != object:
+            try:
+                value_array = np.asarray(values)
+            except ValueError:
+                value_array = None  # Ragged nested sequences
+            shape = () if count is None else (count,)
+            if value_array is not None and value_array.shape == shape and self._values_fit(value_array):
+                return value_array
+            self._vals = self._vals.astype(object)
+        
+        if count is None:
+            return values
+        if isinstance(values, np.ndarray) and values.ndim == 1:
+            return values
+        
+        # Build the object array element by element, so that np.asarray can
+        # neither coerce mixed values (to strings) nor nest sequences
+        prepared = np.empty(count, dtype=object)
+        for i, value in enumerate(values):
+            prepared[i] = value
+        return prepared
+    
+    def _values_fit(self, value_array: np.ndarray) -> bool:
+        """Check whether every value can be stored in the typed value array without changing it."""
+        target = self._vals.dtype
+        if value_array.size == 0 or np.can_cast(value_array.dtype, target, casting='safe'):
+            return True
+        
+        # Integers of a wider or unsigned type still fit if they are in range
+        if value_array.dtype.kind in 'iu' and target.kind in 'iu':
+            info = np.iinfo(target)
+            return info.min <= value_array.min() and value_array.max() <= info.max
+        return False
     
     def insert(self, key: Any, value: Any) -> bool:
         """
@@ -146,33 +652,142 @@ class UniversalHashTable:
         Returns:
             True if insertion was successful
         """
-        # Check if we need to resize (load factor > 0.75)
-        if self._get_load_factor() > 0.75:
-            self._resize_table(self._find_next_prime(2 * self.size))
+        if self._int_keys:
+            key = self._check_int_key(key)
         
-        hash_index = self._hash(key)
-        self.access_count += 1
+        # Resize up front, before probing, if the key would push the load over 0.5
+        self._reserve(1)
+        value = self._prepare_values(value)
         
-        # Check if key already exists
-        current = self.table[hash_index]
-        while current is not None:
-            if current.key == key:
-                current.value = value  # Update existing key
-                return True
-            current = current.next
+        if self._stats_enabled:
+            self.access_count += 1
         
-        # Insert new key-value pair
-        new_node = HashNode(key, value)
-        new_node.next = self.table[hash_index]
-        self.table[hash_index] = new_node
+        if self._int_keys:
+            index, home_index, previous = _insert_int(self._ctrl, self._keys, self._params, key)
+        else:
+            index, home_index, previous = self._insert_slot(key)
+        self._vals[index] = value
+        
+        if previous & 0x80:
+            return True  # Updated existing key
+        if previous == TOMBSTONE:
+            self._tombstones -= 1
         
-        # Count collision if there was already a node at this index
-        if new_node.next is not None:
+        # Count collision if the key could not be placed in its home slot
+        if self._stats_enabled and index != home_index:
             self.collision_count += 1
         
         self.count += 1
         return True
     
+    def _reserve(self, extra: int):
+        """
+        Resize the table once, if needed, so that `extra` more keys fit without another resize.
+        
+        The check counts tombstones, since they occupy slots until the table
+        is rebuilt, but the new size is computed from live keys only: when
+        most occupied slots are tombstones the table is rebuilt at the same
+        size instead of doubling again.
+        
+        Args:
+            extra: Number of keys about to be inserted
+        """
+        if (self.count + self._tombstones + extra) / self.size <= 0.5:
+            return
+        
+        # Grow unless live keys alone are few enough that clearing the
+        # tombstones buys room for at least size / 4 more inserts
+        new_size = self.size
+        if (self.count + extra) / new_size > 0.25:
+            new_size *= 2
+        while (self.count + extra) / new_size > 0.5:
+            new_size *= 2
+        
+        self._resize_table(new_size)
+    
+    def bulk_insert(self, keys: np.ndarray, values: Any) -> int:
+        """
+        Insert a batch of key-value pairs.
+        
+        Integer-key tables insert the whole batch in a single compiled loop;
+        other tables fall back to calling insert for each pair.
+        
+        Args:
+            keys: Array or sequence of keys
+            values: Sequence of values, one per key
+            
+        Returns:
+            Number of pairs processed
+        """
+        if not self._int_keys:
+            self._reserve(len(keys))
+            # tolist turns numpy scalars into the Python objects the table stores
+            for key, value in zip(keys.tolist() if isinstance(keys, np.ndarray) else keys, values):
+                self.insert(key, value)
+            return len(keys)
+        
+        keys = self._check_int_keys(keys)
+        values = self._prepare_values(values, len(keys))
+        self._reserve(len(keys))
+        slots, inserted, reused, collisions = _bulk_insert_int(self._ctrl, self._keys, self._params, keys)
+        self._vals[slots] = values
+        
+        if self._stats_enabled:
+            self.access_count += len(keys)
+            self.collision_count += collisions
+        self._tombstones -= reused
+        self.count += inserted
+        return len(keys)
+    
+    def bulk_search(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Search for a batch of keys.
+        
+        Args:
+            keys: Array or sequence of keys to search for
+            
+        Returns:
+            Object array of the values found, with None for missing keys
+        """
+        result = np.full(len(keys), None, dtype=object)
+        
+        if not self._int_keys:
+            for i, key in enumerate(keys.tolist() if isinstance(keys, np.ndarray) else keys):
+                result[i] = self.search(key)
+            return result
+        
+        slots = _bulk_probe_int(self._ctrl, self._keys, self._params, self._check_int_keys(keys))
+        if self._stats_enabled:
+            self.access_count += len(keys)
+        
+        found = slots >= 0
+        result[found] = self._vals[slots[found]]
+        return result
+    
+    def bulk_delete(self, keys: np.ndarray) -> int:
+        """
+        Delete a batch of keys.
+        
+        Args:
+            keys: Array or sequence of keys to delete
+            
+        Returns:
+            Number of keys that were found and deleted
+        """
+        if not self._int_keys:
+            return sum(self.delete(key) for key in (keys.tolist() if isinstance(keys, np.ndarray) else keys))
+        
+        slots = _bulk_delete_int(self._ctrl, self._keys, self._params, self._check_int_keys(keys))
+        if self._stats_enabled:
+            self.access_count += len(keys)
+        
+        deleted = slots[slots >= 0]
+        if self._vals.dtype == object:
+            self._vals[deleted] = None  # Release the stored values
+        self.count -= len(deleted)
+        self._tombstones += len(deleted)
+        return len(deleted)
+    
     def search(self, key: Any) -> Optional[Any]:
         """
         Search for a key in the hash table.
@@ -183,16 +798,14 @@ class UniversalHashTable:
         Returns:
             The value associated with the key, or None if not found
         """
-        hash_index = self._hash(key)
-        self.access_count += 1
+        if self._stats_enabled:
+            self.access_count += 1
         
-        current = self.table[hash_index]
-        while current is not None:
-            if current.key == key:
-                return current.value
-            current = current.next
+        index = self._find_slot(key)
+        if index < 0:
+            return None
         
-        return None
+        return self._vals[index]
     
     def delete(self, key: Any) -> bool:
         """
@@ -204,27 +817,20 @@ class UniversalHashTable:
         Returns:
             True if deletion was successful, False if key not found
         """
-        hash_index = self._hash(key)
-        self.access_count += 1
-        
-        current = self.table[hash_index]
-        previous = None
+        if self._stats_enabled:
+            self.access_count += 1
         
-        while current is not None:
-            if current.key == key:
-                if previous is None:
-                    # First node in the chain
-                    self.table[hash_index] = current.next
-                else:
-                    previous.next = current.next
-                
-                self.count -= 1
-                return True
-            
-            previous = current
-            current = current.next
+        index = self._find_slot(key)
+        if index < 0:
+            return False
         
-        return False
+        # Leave a tombstone so probe sequences passing through stay intact
+        self._ctrl[index] = TOMBSTONE
+        if self._vals.dtype == object:
+            self._vals[index] = None  # Release the stored value
+        self.count -= 1
+        self._tombstones += 1
+        return True
     
     def get_stats(self) -> dict:
         """
@@ -249,16 +855,34 @@ class UniversalHashTable:
         
         for i in range(self.size):
             print(f"Index {i:2d}: ", end="")
-            current = self.table[i]
+            ctrl = self._ctrl[i]
             
-            if current is None:
+            if ctrl == EMPTY:
                 print("Empty")
+            elif ctrl == TOMBSTONE:
+                print("Deleted")
             else:
-                elements = []
-                while current is not None:
-                    elements.append(f"({current.key}, {current.value})")
-                    current = current.next
-                print(" -> ".join(elements))
+                print(f"({self._keys[i]}, {self._vals[i]})")
+
+
+class IntIntHashTable(UniversalHashTable):
+    """
+    Hash table specialized for integer keys mapped to integer values.
+    
+    Values are stored unboxed in an int64 array next to the keys (8 bytes
+    per entry instead of a 28-byte Python int), so no int objects are
+    created or reference counted per entry, and a batch insert moves keys
+    and values with plain array copies.
+    """
+    
+    def __init__(self, initial_size: int = 16):
+        """
+        Initialize an int-to-int hash table.
+        
+        Args:
+            initial_size: Initial size of the hash table (rounded up to a power of two, at least 16)
+        """
+        super().__init__(initial_size, key_kind='int', value_dtype=np.int64)
 
 
 class HashTableAnalyzer:
@@ -266,6 +890,23 @@ class HashTableAnalyzer:
     
     def __init__(self):
         self.operation_times = {'insert': [], 'search': [], 'delete': []}
+        self._rng = np.random.default_rng()
+    
+    def create_table(self, data_type: str) -> UniversalHashTable:
+        """
+        Create the hash table best suited to a test data type.
+        
+        Args:
+            data_type: Type of data ('random', 'sequential', 'strings')
+            
+        Returns:
+            Empty hash table
+        """
+        if data_type == 'random':
+            return IntIntHashTable()
+        elif data_type == 'strings':
+            return UniversalHashTable(key_kind='str')
+        return UniversalHashTable(key_kind='int')
     
     def measure_operation(self, operation_func, *args, **kwargs) -> Tuple[float, Any]:
         """
@@ -279,11 +920,11 @@ class HashTableAnalyzer:
         Returns:
             Tuple of (execution_time, result)
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = operation_func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         
-        execution_time = end_time - start_time
+        execution_time = (end_time - start_time) * 1e-9
         return execution_time, result
     
     def generate_test_data(self, size: int, data_type: str) -> List[Tuple[Any, Any]]:
@@ -298,7 +939,9 @@ class HashTableAnalyzer:
             List of (key, value) tuples
         """
         if data_type == 'random':
-            return [(random.randint(1, size * 2), random.randint(1, 1000)) for _ in range(size)]
+            keys = self._rng.integers(1, size * 2 + 1, size=size, dtype=np.int64)
+            values = self._rng.integers(1, 1001, size=size, dtype=np.int64)
+            return list(zip(keys.tolist(), values.tolist()))
         elif data_type == 'sequential':
             return [(i, f"value_{i}") for i in range(1, size + 1)]
         elif data_type == 'strings':
@@ -320,6 +963,13 @@ class HashTableAnalyzer:
         """
         results = {}
         
+        # Compile the integer kernels (resize included) before anything is timed
+        warm_up_keys = np.arange(GROUP_WIDTH, dtype=np.int64)
+        warm_up_table = UniversalHashTable(key_kind='int')
+        warm_up_table.bulk_insert(warm_up_keys, warm_up_keys)
+        warm_up_table.bulk_search(warm_up_keys)
+        warm_up_table.bulk_delete(warm_up_keys)
+        
         for size in sizes:
             results[size] = {}
             
@@ -333,36 +983,31 @@ class HashTableAnalyzer:
                 
                 for _ in range(iterations):
                     # Create fresh hash table for each iteration
-                    hash_table = UniversalHashTable()
+                    hash_table = self.create_table(data_type)
+                    hash_table.enable_stats()
                     
                     # Generate test data
                     test_data = self.generate_test_data(size, data_type)
                     
-                    # Test insertions
-                    insert_times = []
-                    for key, value in test_data:
-                        time_taken, _ = self.measure_operation(hash_table.insert, key, value)
-                        insert_times.append(time_taken)
+                    # Unpack once into flat arrays; the phases below only slice them
+                    key_dtype = object if data_type == 'strings' else np.int64
+                    value_dtype = np.int64 if data_type == 'random' else object
+                    keys = np.fromiter((key for key, _ in test_data), dtype=key_dtype, count=size)
+                    values = np.fromiter((value for _, value in test_data), dtype=value_dtype, count=size)
                     
-                    results[size][data_type]['insert_times'].append(np.mean(insert_times))
+                    # Test insertions (timed as one batch, reported per operation)
+                    time_taken, _ = self.measure_operation(hash_table.bulk_insert, keys, values)
+                    results[size][data_type]['insert_times'].append(time_taken / size)
                     
                     # Test searches (search for half the keys)
-                    search_times = []
-                    search_keys = [key for key, _ in test_data[:size//2]]
-                    for key in search_keys:
-                        time_taken, _ = self.measure_operation(hash_table.search, key)
-                        search_times.append(time_taken)
-                    
-                    results[size][data_type]['search_times'].append(np.mean(search_times))
+                    search_keys = keys[:size//2]
+                    time_taken, _ = self.measure_operation(hash_table.bulk_search, search_keys)
+                    results[size][data_type]['search_times'].append(time_taken / max(len(search_keys), 1))
                     
                     # Test deletions (delete quarter of the keys)
-                    delete_times = []
-                    delete_keys = [key for key, _ in test_data[:size//4]]
-                    for key in delete_keys:
-                        time_taken, _ = self.measure_operation(hash_table.delete, key)
-                        delete_times.append(time_taken)
-                    
-                    results[size][data_type]['delete_times'].append(np.mean(delete_times))
+                    delete_keys = keys[:size//4]
+                    time_taken, _ = self.measure_operation(hash_table.bulk_delete, delete_keys)
+                    results[size][data_type]['delete_times'].append(time_taken / max(len(delete_keys), 1))
                     
                     # Store final statistics
                     results[size][data_type]['final_stats'].append(hash_table.get_stats())
@@ -400,11 +1045,12 @@ class HashTableAnalyzer:
 
 def main():
     """Main function to demonstrate the hash table implementation."""
-    print("Testing Hash Table with Chaining")
+    print("Testing Hash Table with Open Addressing")
     print("=" * 50)
     
     # Create hash table
-    hash_table = UniversalHashTable(initial_size=7)
+    hash_table = UniversalHashTable(initial_size=7, key_kind='int')
+    hash_table.enable_stats()
     
     # Test basic operations
     print("Testing basic operations:")
@@ -9,7 +9,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import time
 from typing import Dict, List, Tuple
-from quicksort import QuicksortAnalyzer
+from quicksort import QuicksortAnalyzer, speedup_ratio
 from hash_table import HashTableAnalyzer
 
 
@@ -28,8 +28,9 @@ class PerformanceAnalyzer:
         sizes = [100, 500, 1000, 2000, 5000]
         data_types = ['random', 'sorted', 'reverse', 'duplicates']
         
+        # First-element pivots, so the deterministic worst case shows up on sorted input
         results = self.quicksort_analyzer.run_performance_comparison(
-            sizes, data_types, iterations=5
+            sizes, data_types, iterations=5, strategy='first'
         )
         
         # Generate performance plots
@@ -59,35 +60,35 @@ class PerformanceAnalyzer:
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Quicksort Performance Analysis', fontsize=16)
         
-        sizes = list(results['randomized'].keys())
-        data_types = ['random', 'sorted', 'reverse', 'duplicates']
+        sizes = results['sizes']
+        data_types = results['data_types']
+        randomized = results['algorithms'].index('randomized')
+        deterministic = results['algorithms'].index('deterministic')
+        
+        # Best time and average comparisons per (algorithm, size, data type)
+        best_times = results['data'][..., results['metrics'].index('times')].min(axis=3)
+        mean_comps = results['data'][..., results['metrics'].index('comparisons')].mean(axis=3)
         
-        # Plot 1: Average execution time by data type
+        # Plot 1: Best execution time by data type
         ax1 = axes[0, 0]
-        for data_type in data_types:
-            rand_times = []
-            det_times = []
-            for size in sizes:
-                rand_times.append(np.mean(results['randomized'][size][data_type]['times']))
-                det_times.append(np.mean(results['deterministic'][size][data_type]['times']))
+        for j, data_type in enumerate(data_types):
+            rand_times = best_times[randomized, :, j]
+            det_times = best_times[deterministic, :, j]
             
             ax1.plot(sizes, rand_times, 'o-', label=f'Randomized - {data_type}', alpha=0.7)
             ax1.plot(sizes, det_times, 's--', label=f'Deterministic - {data_type}', alpha=0.7)
         
         ax1.set_xlabel('Array Size')
-        ax1.set_ylabel('Average Time (seconds)')
+        ax1.set_ylabel('Best Time (seconds)')
         ax1.set_title('Execution Time Comparison')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
         # Plot 2: Comparison count by data type
         ax2 = axes[0, 1]
-        for data_type in data_types:
-            rand_comps = []
-            det_comps = []
-            for size in sizes:
-                rand_comps.append(np.mean(results['randomized'][size][data_type]['comparisons']))
-                det_comps.append(np.mean(results['deterministic'][size][data_type]['comparisons']))
+        for j, data_type in enumerate(data_types):
+            rand_comps = mean_comps[randomized, :, j]
+            det_comps = mean_comps[deterministic, :, j]
             
             ax2.plot(sizes, rand_comps, 'o-', label=f'Randomized - {data_type}', alpha=0.7)
             ax2.plot(sizes, det_comps, 's--', label=f'Deterministic - {data_type}', alpha=0.7)
@@ -98,34 +99,27 @@ class PerformanceAnalyzer:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        # Plot 3: Performance improvement percentage
+        # Plot 3: Speedup of randomized over deterministic
         ax3 = axes[1, 0]
-        for data_type in data_types:
-            improvements = []
-            for size in sizes:
-                rand_time = np.mean(results['randomized'][size][data_type]['times'])
-                det_time = np.mean(results['deterministic'][size][data_type]['times'])
-                improvement = (det_time - rand_time) / det_time * 100
-                improvements.append(improvement)
+        for j, data_type in enumerate(data_types):
+            rand_times = best_times[randomized, :, j]
+            det_times = best_times[deterministic, :, j]
+            speedups = speedup_ratio(det_times, rand_times)
             
-            ax3.plot(sizes, improvements, 'o-', label=data_type, alpha=0.7)
+            ax3.plot(sizes, speedups, 'o-', label=data_type, alpha=0.7)
         
         ax3.set_xlabel('Array Size')
-        ax3.set_ylabel('Time Improvement (%)')
-        ax3.set_title('Randomized vs Deterministic Improvement')
+        ax3.set_ylabel('Time Speedup (x)')
+        ax3.set_title('Randomized vs Deterministic Speedup')
         ax3.legend()
         ax3.grid(True, alpha=0.3)
         
         # Plot 4: Theoretical vs Empirical comparison
         ax4 = axes[1, 1]
-        theoretical_times = []
-        empirical_times = []
-        
-        for size in sizes:
-            # Theoretical: O(n log n)
-            theoretical_times.append(size * np.log2(size))
-            # Empirical: average of randomized quicksort on random data
-            empirical_times.append(np.mean(results['randomized'][size]['random']['times']) * 1000000)  # Scale for visibility
+        # Theoretical: O(n log n)
+        theoretical_times = np.array(sizes) * np.log2(sizes)
+        # Empirical: best time of randomized quicksort on random data
+        empirical_times = best_times[randomized, :, data_types.index('random')] * 1000000  # Scale for visibility
         
         ax4.plot(sizes, theoretical_times, 'o-', label='Theoretical O(n log n)', alpha=0.7)
         ax4.plot(sizes, empirical_times, 's--', label='Empirical (scaled)', alpha=0.7)
@@ -225,16 +219,20 @@ class PerformanceAnalyzer:
         print("-" * 40)
         
         # Analyze worst case scenarios
-        sizes = list(quicksort_results['randomized'].keys())
+        sizes = quicksort_results['sizes']
+        best_times = quicksort_results['data'][..., quicksort_results['metrics'].index('times')].min(axis=3)
+        sorted_times = best_times[:, :, quicksort_results['data_types'].index('sorted')]
+        randomized = quicksort_results['algorithms'].index('randomized')
+        deterministic = quicksort_results['algorithms'].index('deterministic')
         
         print("Worst-case scenarios (sorted arrays):")
-        for size in sizes:
-            rand_time = np.mean(quicksort_results['randomized'][size]['sorted']['times'])
-            det_time = np.mean(quicksort_results['deterministic'][size]['sorted']['times'])
-            improvement = (det_time - rand_time) / det_time * 100
+        for i, size in enumerate(sizes):
+            rand_time = sorted_times[randomized, i]
+            det_time = sorted_times[deterministic, i]
+            speedup = speedup_ratio(det_time, rand_time)
             
             print(f"  Size {size}: Randomized {rand_time:.6f}s, Deterministic {det_time:.6f}s")
-            print(f"    Improvement: {improvement:.2f}%")
+            print(f"    Speedup: {speedup:.2f}x")
         
         # Hash table analysis summary
         print("\n2. HASH TABLE ANALYSIS SUMMARY")
@@ -257,10 +255,10 @@ class PerformanceAnalyzer:
         print("  - Worst case (deterministic): O(n²) ✓")
         print("  - Worst case (randomized): O(n log n) with high probability ✓")
         
-        print("\nHash Table Time Complexity (with chaining):")
-        print("  - Insert (average): O(1 + α) where α = load factor ✓")
-        print("  - Search (average): O(1 + α) where α = load factor ✓")
-        print("  - Delete (average): O(1 + α) where α = load factor ✓")
+        print("\nHash Table Time Complexity (with open addressing):")
+        print("  - Insert (average): O(1 / (1 - α)) where α = load factor ✓")
+        print("  - Search (average): O(1 / (1 - α)) where α = load factor ✓")
+        print("  - Delete (average): O(1 / (1 - α)) where α = load factor ✓")
         
         # Load factor analysis
         print("\n4. LOAD FACTOR IMPACT ANALYSIS")
@@ -274,7 +272,7 @@ class PerformanceAnalyzer:
                 ])
                 
                 print(f"  Size {size}: Average load factor = {avg_load_factor:.3f}")
-                if avg_load_factor > 0.75:
+                if avg_load_factor > 0.5:
                     print("    ⚠️  High load factor detected - consider resizing")
                 else:
                     print("    ✓ Load factor within acceptable range")
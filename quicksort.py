@@ -3,30 +3,409 @@ Randomized Quicksort and Deterministic Quicksort Implementation
 Author: Mausam 
 """
 
-import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import List, Tuple, Callable
+from numba import njit
+from typing import List, Optional, Tuple, Callable
+
+
+# Slots of the counters array shared by the compiled kernels
+COMPARISONS = 0
+SWAPS = 1
+
+# Pivot strategies of the quicksort kernel (the deterministic sort offers the first two)
+PIVOT_FIRST = 0
+PIVOT_MEDIAN3 = 1
+PIVOT_RANDOM = 2
+PIVOT_STRATEGIES = {'first': PIVOT_FIRST, 'median3': PIVOT_MEDIAN3}
+
+# Layout of the results array returned by run_performance_comparison
+ALGORITHMS = ('randomized', 'deterministic', 'numpy')
+METRICS = ('times', 'comparisons', 'swaps')
+
+# Added to both sides of a speedup ratio so a zero time or count cannot divide by zero
+SPEEDUP_EPS = 1e-9
+
+# Subarrays with fewer elements than this are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+# Elements scanned per block by the block partition (offsets must fit in a uint8)
+PARTITION_BLOCK = 64
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _partition(arr, low, high, pivot_index, counts):
+    """
+    Compiled Lomuto partition of arr[low..high] around arr[pivot_index].
+    
+    Only QuicksortAnalyzer.partition uses it; the sorts partition with
+    _block_partition instead.
+    """
+    # Move pivot to the end
+    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+    
+    pivot = arr[high]
+    i = low - 1
+    
+    # Counts stay in locals inside the loop and are written back once
+    swp = 0
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+            swp += 1
+    
+    # Move pivot to its correct position
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    
+    counts[COMPARISONS] += high - low
+    counts[SWAPS] += swp + 2
+    
+    return i + 1
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _block_partition(arr, low, high, pivot_index, offsets_l, offsets_r, counts):
+    """
+    Compiled BlockQuicksort partition of arr[low..high] (Edelkamp & Weiss).
+    
+    Elements are compared against the pivot a block at a time, and the
+    comparison only adds 0 or 1 to a counter while the element's offset is
+    written unconditionally, so the scan has no data-dependent branch to
+    mispredict. The offsets of misplaced elements found in a left and a
+    right block are then swapped pairwise. What remains after the last
+    full blocks is finished with a plain Hoare scan.
+    
+    Args:
+        offsets_l, offsets_r: uint8 scratch buffers of PARTITION_BLOCK entries
+    
+    Returns:
+        Final position of the pivot; elements before it are smaller and
+        elements after it are greater or equal
+    """
+    # Move pivot to the front
+    arr[pivot_index], arr[low] = arr[low], arr[pivot_index]
+    pivot = arr[low]
+    
+    # arr[low + 1..l - 1] < pivot and arr[r..high] >= pivot throughout
+    l = low + 1
+    r = high + 1
+    num_l = 0
+    num_r = 0
+    start_l = 0
+    start_r = 0
+    comp = 0
+    swp = 1
+    while r - l > 2 * PARTITION_BLOCK:
+        if num_l == 0:
+            start_l = 0
+            for i in range(PARTITION_BLOCK):
+                offsets_l[num_l] = i
+                num_l += arr[l + i] >= pivot
+            comp += PARTITION_BLOCK
+        if num_r == 0:
+            start_r = 0
+            for i in range(PARTITION_BLOCK):
+                offsets_r[num_r] = i
+                num_r += arr[r - 1 - i] < pivot
+            comp += PARTITION_BLOCK
+        
+        num = min(num_l, num_r)
+        for k in range(num):
+            a = l + offsets_l[start_l + k]
+            b = r - 1 - offsets_r[start_r + k]
+            arr[a], arr[b] = arr[b], arr[a]
+        swp += num
+        
+        num_l -= num
+        num_r -= num
+        start_l += num
+        start_r += num
+        if num_l == 0:
+            l += PARTITION_BLOCK
+        if num_r == 0:
+            r -= PARTITION_BLOCK
+    
+    # Hoare scan over the rest, including any partly processed block
+    i = l
+    j = r - 1
+    while True:
+        while i <= j:
+            comp += 1
+            if arr[i] >= pivot:
+                break
+            i += 1
+        while i <= j:
+            comp += 1
+            if arr[j] < pivot:
+                break
+            j -= 1
+        if i > j:
+            break
+        arr[i], arr[j] = arr[j], arr[i]
+        swp += 1
+        i += 1
+        j -= 1
+    
+    # Move pivot to its correct position
+    arr[low], arr[i - 1] = arr[i - 1], arr[low]
+    swp += 1
+    
+    counts[COMPARISONS] += comp
+    counts[SWAPS] += swp
+    return i - 1
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _partition_equal(arr, low, high, pivot_index, counts):
+    """
+    Gather the copies of a pivot that is the minimum of arr[low..high] at the front.
+    
+    Returns:
+        Index of the last copy; arr[low..index] all equal the pivot
+    """
+    pivot = arr[pivot_index]
+    i = low
+    swp = 0
+    for j in range(low, high + 1):
+        if arr[j] == pivot:
+            arr[i], arr[j] = arr[j], arr[i]
+            i += 1
+            swp += 1
+    counts[COMPARISONS] += high - low + 1
+    counts[SWAPS] += swp
+    return i - 1
+
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def _insertion_sort(arr, low, high, counts):
+    """Compiled insertion sort of arr[low..high]; each element shifted counts as a swap."""
+    comp = 0
+    swp = 0
+    for i in range(low + 1, high + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= low:
+            comp += 1
+            if arr[j] <= value:
+                break
+            arr[j + 1] = arr[j]
+            swp += 1
+            j -= 1
+        arr[j + 1] = value
+    counts[COMPARISONS] += comp
+    counts[SWAPS] += swp
+
+
+@njit(cache=True, nogil=True)
+def _median_of_three(arr, low, high, counts):
+    """
+    Order arr[low], arr[mid] and arr[high] in place and return mid.
+    
+    arr[mid] then holds the median of the three, which splits sorted and
+    reverse-sorted runs evenly instead of peeling off one element.
+    """
+    mid = (low + high) // 2
+    comp = 2
+    swp = 0
+    if arr[mid] < arr[low]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+        swp += 1
+    if arr[high] < arr[mid]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+        swp += 1
+        comp += 1
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+            swp += 1
+    counts[COMPARISONS] += comp
+    counts[SWAPS] += swp
+    return mid
+
+
+@njit(cache=True, nogil=True)
+def _xorshift(state):
+    """Advance an xorshift64* generator; returns (new state, 64 random bits)."""
+    state ^= state >> np.uint64(12)
+    state ^= state << np.uint64(25)
+    state ^= state >> np.uint64(27)
+    return state, state * np.uint64(0x2545F4914F6CDD1D)
+
+
+@njit(cache=True, nogil=True)
+def _quicksort(arr, low, high, counts, strategy, pivot_state):
+    """
+    Compiled quicksort of arr[low..high], picking pivots with a PIVOT_* strategy.
+    
+    Random pivots come from an xorshift64* generator held in a local
+    variable, so drawing one costs a few shifts. Its state is loaded from
+    the one-element pivot_state array and stored back at the end, so
+    successive sorts continue the same sequence without reseeding.
+    
+    Every range except the leftmost one has, just before it, an element
+    no greater than any element in it (an earlier pivot). When the new
+    pivot equals that element it is the range minimum, so its copies are
+    gathered and dropped in one pass instead of being partitioned again
+    (the pdqsort rule for duplicates).
+    """
+    state = pivot_state[0]
+    first = low
+    offsets_l = np.empty(PARTITION_BLOCK, dtype=np.uint8)
+    offsets_r = np.empty(PARTITION_BLOCK, dtype=np.uint8)
+    
+    # Iterate over an explicit stack instead of recursing
+    stack = [(low, high)]
+    
+    while len(stack) > 0:
+        low, high = stack.pop()
+        
+        if high - low + 1 < INSERTION_THRESHOLD:
+            _insertion_sort(arr, low, high, counts)
+        else:
+            if strategy == PIVOT_RANDOM:
+                state, bits = _xorshift(state)
+                pivot_index = low + np.int64(bits % np.uint64(high - low + 1))
+            elif strategy == PIVOT_MEDIAN3:
+                pivot_index = _median_of_three(arr, low, high, counts)
+            else:
+                pivot_index = low
+            
+            if low > first:
+                counts[COMPARISONS] += 1
+            if low > first and arr[low - 1] == arr[pivot_index]:
+                lt = low
+                gt = _partition_equal(arr, low, high, pivot_index, counts)
+            else:
+                lt = gt = _block_partition(arr, low, high, pivot_index, offsets_l, offsets_r, counts)
+            
+            # Push the larger side first so the smaller one is sorted next,
+            # which keeps the stack O(log n) deep
+            if lt - 1 - low > high - gt - 1:
+                stack.append((low, lt - 1))
+                stack.append((gt + 1, high))
+            else:
+                stack.append((gt + 1, high))
+                stack.append((low, lt - 1))
+    
+    pivot_state[0] = state
+
+
+def speedup_ratio(baseline, candidate):
+    """
+    How many times smaller candidate is than baseline (e.g. a time or a comparison count).
+    
+    Works elementwise on arrays. Unlike a percentage change, the ratio is
+    symmetric (2.0 and 0.5 are equally large differences) and stays finite
+    when either value is zero.
+    """
+    return (baseline + SPEEDUP_EPS) / (candidate + SPEEDUP_EPS)
+
+
+def _as_int64(arr) -> np.ndarray:
+    """
+    Return arr as a contiguous int64 array (arr itself when it already is one).
+    
+    Raises:
+        TypeError: If arr holds values that int64 cannot represent exactly
+            (floats, strings, integers beyond 64 bits), which a cast would
+            silently truncate
+    """
+    data = np.asarray(arr)
+    if data.size and not np.can_cast(data.dtype, np.int64, 'safe'):
+        raise TypeError(f"Expected integer values, got {data.dtype}")
+    return np.ascontiguousarray(data, dtype=np.int64)
+
+
+def _check_bounds(n: int, low: int, high: int):
+    """Raise IndexError unless a non-empty range [low..high] lies within n elements."""
+    if low <= high and (low < 0 or high >= n):
+        raise IndexError(f"Range [{low}..{high}] out of bounds for {n} elements")
 
 
 class QuicksortAnalyzer:
-    """Implementation and analysis of Randomized and Deterministic Quicksort algorithms."""
+    """
+    Implementation and analysis of Randomized and Deterministic Quicksort algorithms.
+    
+    The sorts run as Numba-compiled kernels over int64 arrays; the methods
+    here convert their input once, dispatch to the kernel and collect the
+    comparison and swap counts it accumulates. The kernels release the GIL,
+    so separate analyzers can sort on separate threads in parallel.
+    """
+    
+    # No per-instance __dict__: the attributes live in fixed slots
+    __slots__ = ('_counts', '_pivot_state', '_seed_seq', '_rng')
+    
+    def __init__(self, seed: Optional[np.random.SeedSequence] = None):
+        """
+        Initialize the analyzer.
+        
+        Args:
+            seed: Seed for the test data and the random pivots (default: fresh entropy)
+        """
+        # [comparisons, swaps], updated in place by the compiled kernels
+        self._counts = np.zeros(2, dtype=np.int64)
+        # Kept so the sweep can spawn per-cell seeds from it
+        self._seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_seq)
+        # xorshift state of the random pivots, advanced in place by the kernel
+        # (seeded once here from a child sequence, so it is independent of
+        # the data generator; xorshift needs a non-zero state)
+        pivot_seq = self._seed_seq.spawn(1)[0]
+        self._pivot_state = pivot_seq.generate_state(1, dtype=np.uint64) | np.uint64(1)
+    
+    @property
+    def comparison_count(self) -> int:
+        """Comparisons made since the last reset."""
+        return int(self._counts[COMPARISONS])
     
-    def __init__(self):
-        self.comparison_count = 0
-        self.swap_count = 0
+    @property
+    def swap_count(self) -> int:
+        """Swaps made since the last reset."""
+        return int(self._counts[SWAPS])
     
     def reset_counts(self):
         """Reset comparison and swap counters."""
-        self.comparison_count = 0
-        self.swap_count = 0
+        self._counts[:] = 0
+    
+    def _run_kernel(self, kernel: Callable, arr, low: int, high: int, *args):
+        """
+        Run a compiled sort kernel on arr[low..high].
+        
+        Args:
+            kernel: Compiled function taking (array, low, high, counts, *args)
+            arr: Array or list to sort in place
+            low: Starting index (default: 0)
+            high: Ending index (default: len(arr) - 1)
+            args: Extra kernel arguments
+        
+        Raises:
+            TypeError: If arr holds non-integer values
+            IndexError: If [low..high] does not lie within arr
+        """
+        if low is None:
+            low = 0
+        if high is None:
+            high = len(arr) - 1
+        
+        data = _as_int64(arr)
+        # The kernels skip bounds checks, so a bad range must not reach them
+        _check_bounds(len(data), low, high)
+        kernel(data, low, high, self._counts, *args)
+        
+        # Copy back if the input could not be sorted in place
+        if data is not arr:
+            arr[:] = data.tolist() if isinstance(arr, list) else data
     
-    def partition(self, arr: List[int], low: int, high: int, pivot_index: int) -> int:
+    def partition(self, arr: np.ndarray, low: int, high: int, pivot_index: int) -> int:
         """
         Partition the array around the pivot element.
         
+        This is a standalone Lomuto partition, kept for direct use; the
+        sorts themselves partition with the block kernel.
+        
         Args:
-            arr: The array to partition
+            arr: The int64 array to partition
             low: Starting index
             high: Ending index
             pivot_index: Index of the pivot element
@@ -34,27 +413,12 @@ class QuicksortAnalyzer:
         Returns:
             Final position of the pivot element
         """
-        # Move pivot to the end
-        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
-        self.swap_count += 1
-        
-        pivot = arr[high]
-        i = low - 1
-        
-        for j in range(low, high):
-            self.comparison_count += 1
-            if arr[j] <= pivot:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-                self.swap_count += 1
-        
-        # Move pivot to its correct position
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        self.swap_count += 1
-        
-        return i + 1
+        _check_bounds(len(arr), low, high)
+        if not low <= pivot_index <= high:
+            raise IndexError(f"Pivot index {pivot_index} outside [{low}..{high}]")
+        return _partition(arr, low, high, pivot_index, self._counts)
     
-    def randomized_quicksort(self, arr: List[int], low: int = None, high: int = None) -> None:
+    def randomized_quicksort(self, arr: np.ndarray, low: int = None, high: int = None) -> None:
         """
         Randomized Quicksort implementation.
         Pivot is chosen uniformly at random from the subarray.
@@ -64,59 +428,43 @@ class QuicksortAnalyzer:
             low: Starting index (default: 0)
             high: Ending index (default: len(arr) - 1)
         """
-        if low is None:
-            low = 0
-        if high is None:
-            high = len(arr) - 1
-        
-        if low < high:
-            # Choose random pivot
-            pivot_index = random.randint(low, high)
-            
-            # Partition around the pivot
-            pivot_pos = self.partition(arr, low, high, pivot_index)
-            
-            # Recursively sort elements before and after partition
-            self.randomized_quicksort(arr, low, pivot_pos - 1)
-            self.randomized_quicksort(arr, pivot_pos + 1, high)
+        self._run_kernel(_quicksort, arr, low, high, PIVOT_RANDOM, self._pivot_state)
     
-    def deterministic_quicksort(self, arr: List[int], low: int = None, high: int = None) -> None:
+    def deterministic_quicksort(self, arr: np.ndarray, low: int = None, high: int = None,
+                                strategy: str = 'median3') -> None:
         """
         Deterministic Quicksort implementation.
-        Pivot is always the first element.
+        Pivot is the median of the first, middle and last elements, or
+        always the first element with strategy='first' (O(n²) on sorted input).
         
         Args:
             arr: Array to sort
             low: Starting index (default: 0)
             high: Ending index (default: len(arr) - 1)
+            strategy: Pivot strategy ('median3' or 'first')
         """
-        if low is None:
-            low = 0
-        if high is None:
-            high = len(arr) - 1
+        if strategy not in PIVOT_STRATEGIES:
+            raise ValueError(f"Unknown pivot strategy: {strategy}")
+        self._run_kernel(_quicksort, arr, low, high, PIVOT_STRATEGIES[strategy], self._pivot_state)
+    
+    def numpy_quicksort(self, arr: np.ndarray) -> None:
+        """
+        Sort with np.sort, as a baseline for the two quicksorts.
         
-        # Use iterative approach to avoid recursion depth issues
-        stack = [(low, high)]
+        NumPy's quicksort is an introsort with SIMD (AVX2/AVX-512) partitioning
+        where the CPU supports it, so it shows the practical ceiling for
+        in-memory int64 sorting. It does not update the counters.
         
-        while stack:
-            low, high = stack.pop()
-            
-            if low < high:
-                # Choose first element as pivot
-                pivot_index = low
-                
-                # Partition around the pivot
-                pivot_pos = self.partition(arr, low, high, pivot_index)
-                
-                # Add subarrays to stack (process larger subarray first to limit stack size)
-                if pivot_pos - 1 - low > high - pivot_pos - 1:
-                    stack.append((low, pivot_pos - 1))
-                    stack.append((pivot_pos + 1, high))
-                else:
-                    stack.append((pivot_pos + 1, high))
-                    stack.append((low, pivot_pos - 1))
-    
-    def measure_performance(self, arr: List[int], sort_func: Callable) -> Tuple[float, int, int]:
+        Args:
+            arr: Array to sort
+        """
+        if isinstance(arr, np.ndarray) and arr.dtype == np.int64:
+            arr.sort(kind='quicksort')  # In place, no temporary copy
+        else:
+            data = np.sort(_as_int64(arr), kind='quicksort')
+            arr[:] = data.tolist() if isinstance(arr, list) else data
+    
+    def measure_performance(self, arr: np.ndarray, sort_func: Callable) -> Tuple[float, int, int]:
         """
         Measure the performance of a sorting function.
         
@@ -127,22 +475,22 @@ class QuicksortAnalyzer:
         Returns:
             Tuple of (execution_time, comparisons, swaps)
         """
-        # Create a copy to avoid modifying the original array
-        test_arr = arr.copy()
+        # Create an int64 array copy to avoid modifying the original array
+        test_arr = _as_int64(arr).copy()
         
         # Reset counters
         self.reset_counts()
         
-        # Measure execution time
-        start_time = time.time()
+        # Measure execution time (monotonic, nanosecond resolution)
+        start_time = time.perf_counter_ns()
         sort_func(test_arr)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         
-        execution_time = end_time - start_time
+        execution_time = (end_time - start_time) / 1e9
         
         return execution_time, self.comparison_count, self.swap_count
     
-    def generate_test_data(self, size: int, data_type: str) -> List[int]:
+    def generate_test_data(self, size: int, data_type: str) -> np.ndarray:
         """
         Generate test data of various types.
         
@@ -151,68 +499,94 @@ class QuicksortAnalyzer:
             data_type: Type of data ('random', 'sorted', 'reverse', 'duplicates')
             
         Returns:
-            Generated array
+            Generated int64 array
         """
         if data_type == 'random':
-            return [random.randint(1, size) for _ in range(size)]
+            return self._rng.integers(1, size + 1, size=size, dtype=np.int64)
         elif data_type == 'sorted':
-            return list(range(1, size + 1))
+            return np.arange(1, size + 1, dtype=np.int64)
         elif data_type == 'reverse':
-            return list(range(size, 0, -1))
+            return np.arange(size, 0, -1, dtype=np.int64)
         elif data_type == 'duplicates':
-            return [random.randint(1, 10) for _ in range(size)]
+            return self._rng.integers(1, 11, size=size, dtype=np.int64)
         else:
             raise ValueError(f"Unknown data type: {data_type}")
     
-    def run_performance_comparison(self, sizes: List[int], data_types: List[str], iterations: int = 5) -> dict:
+    def _run_one_cell(self, size: int, data_type: str, strategy: str,
+                      seed: np.random.SeedSequence) -> Tuple[Tuple[float, int, int], ...]:
+        """
+        Run one iteration of one (size, data type) test case on a private analyzer.
+        
+        Each cell gets its own counters and its own independently seeded data
+        generator, so cells can run on different threads at the same time.
+        
+        Returns:
+            Tuple of (randomized, deterministic, numpy) measurements,
+            each as returned by measure_performance
+        """
+        analyzer = QuicksortAnalyzer(seed)
+        test_data = analyzer.generate_test_data(size, data_type)
+        
+        randomized = analyzer.measure_performance(test_data, analyzer.randomized_quicksort)
+        deterministic = analyzer.measure_performance(
+            test_data, lambda arr: analyzer.deterministic_quicksort(arr, strategy=strategy)
+        )
+        numpy_baseline = analyzer.measure_performance(test_data, analyzer.numpy_quicksort)
+        return randomized, deterministic, numpy_baseline
+    
+    def run_performance_comparison(self, sizes: List[int], data_types: List[str], iterations: int = 5,
+                                   strategy: str = 'median3', workers: int = 1) -> dict:
         """
         Run comprehensive performance comparison between randomized and deterministic quicksort.
         
+        Every (size, data type, iteration) cell is independent, so the cells
+        are run on a thread pool; idle threads take the next cell from the
+        shared queue, which balances the much longer large-size cells.
+        
         Args:
             sizes: List of array sizes to test
             data_types: List of data types to test
             iterations: Number of iterations per test case
+            strategy: Pivot strategy of the deterministic quicksort ('median3' or 'first')
+            workers: Number of threads (default: 1); more threads finish the
+                sweep sooner, but the timings then include thread contention
             
         Returns:
-            Dictionary containing performance results
+            Dictionary with the 'algorithms', 'sizes', 'data_types' and
+            'metrics' axis labels and a 'data' float array of shape
+            (algorithm, size, data type, iteration, metric); the np.sort
+            baseline records no comparisons or swaps
         """
-        results = {
-            'randomized': {},
-            'deterministic': {}
-        }
+        # Compile (or load from the cache) the sort kernels before anything is timed
+        warm_up_data = np.arange(8, 0, -1, dtype=np.int64)
+        self.randomized_quicksort(warm_up_data.copy())
+        self.deterministic_quicksort(warm_up_data.copy(), strategy=strategy)
+        
+        data = np.empty((len(ALGORITHMS), len(sizes), len(data_types), iterations, len(METRICS)))
+        
+        # One task per cell, each with an independent seed for its test data
+        tasks = [(i, j, k) for i in range(len(sizes)) for j in range(len(data_types)) for k in range(iterations)]
+        seeds = self._seed_seq.spawn(len(tasks))
         
-        for size in sizes:
-            results['randomized'][size] = {}
-            results['deterministic'][size] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            cells = executor.map(
+                self._run_one_cell,
+                [sizes[i] for i, _, _ in tasks],
+                [data_types[j] for _, j, _ in tasks],
+                [strategy] * len(tasks),
+                seeds
+            )
             
-            for data_type in data_types:
-                results['randomized'][size][data_type] = {
-                    'times': [], 'comparisons': [], 'swaps': []
-                }
-                results['deterministic'][size][data_type] = {
-                    'times': [], 'comparisons': [], 'swaps': []
-                }
-                
-                for _ in range(iterations):
-                    # Generate test data
-                    test_data = self.generate_test_data(size, data_type)
-                    
-                    # Test randomized quicksort
-                    time_r, comp_r, swap_r = self.measure_performance(
-                        test_data, self.randomized_quicksort
-                    )
-                    results['randomized'][size][data_type]['times'].append(time_r)
-                    results['randomized'][size][data_type]['comparisons'].append(comp_r)
-                    results['randomized'][size][data_type]['swaps'].append(swap_r)
-                    
-                    # Test deterministic quicksort
-                    time_d, comp_d, swap_d = self.measure_performance(
-                        test_data, self.deterministic_quicksort
-                    )
-                    results['deterministic'][size][data_type]['times'].append(time_d)
-                    results['deterministic'][size][data_type]['comparisons'].append(comp_d)
-                    results['deterministic'][size][data_type]['swaps'].append(swap_d)
+            for (i, j, k), measurements in zip(tasks, cells):
+                data[:, i, j, k, :] = measurements
         
+        results = {
+            'algorithms': list(ALGORITHMS),
+            'sizes': list(sizes),
+            'data_types': list(data_types),
+            'metrics': list(METRICS),
+            'data': data
+        }
         return results
     
     def print_results(self, results: dict):
@@ -221,38 +595,47 @@ class QuicksortAnalyzer:
         print("QUICKSORT PERFORMANCE COMPARISON")
         print("=" * 80)
         
-        for size in results['randomized'].keys():
+        algorithms = results['algorithms']
+        metrics = results['metrics']
+        randomized = algorithms.index('randomized')
+        deterministic = algorithms.index('deterministic')
+        baseline = algorithms.index('numpy')
+        comparisons = metrics.index('comparisons')
+        swaps = metrics.index('swaps')
+        
+        # Aggregate over the iteration axis once: best time (which filters
+        # out scheduling noise) and average counts
+        best_times = results['data'][..., metrics.index('times')].min(axis=3)
+        means = results['data'].mean(axis=3)
+        
+        for i, size in enumerate(results['sizes']):
             print(f"\nArray Size: {size}")
             print("-" * 40)
             
-            for data_type in results['randomized'][size].keys():
+            for j, data_type in enumerate(results['data_types']):
                 print(f"\nData Type: {data_type.upper()}")
                 
-                # Calculate averages
-                rand_times = results['randomized'][size][data_type]['times']
-                det_times = results['deterministic'][size][data_type]['times']
-                rand_comps = results['randomized'][size][data_type]['comparisons']
-                det_comps = results['deterministic'][size][data_type]['comparisons']
-                rand_swaps = results['randomized'][size][data_type]['swaps']
-                det_swaps = results['deterministic'][size][data_type]['swaps']
-                
                 print(f"Randomized Quicksort:")
-                print(f"  Avg Time: {np.mean(rand_times):.6f}s")
-                print(f"  Avg Comparisons: {np.mean(rand_comps):.0f}")
-                print(f"  Avg Swaps: {np.mean(rand_swaps):.0f}")
+                print(f"  Best Time: {best_times[randomized, i, j]:.6f}s")
+                print(f"  Avg Comparisons: {means[randomized, i, j, comparisons]:.0f}")
+                print(f"  Avg Swaps: {means[randomized, i, j, swaps]:.0f}")
                 
                 print(f"Deterministic Quicksort:")
-                print(f"  Avg Time: {np.mean(det_times):.6f}s")
-                print(f"  Avg Comparisons: {np.mean(det_comps):.0f}")
-                print(f"  Avg Swaps: {np.mean(det_swaps):.0f}")
+                print(f"  Best Time: {best_times[deterministic, i, j]:.6f}s")
+                print(f"  Avg Comparisons: {means[deterministic, i, j, comparisons]:.0f}")
+                print(f"  Avg Swaps: {means[deterministic, i, j, swaps]:.0f}")
+                
+                print(f"NumPy np.sort (baseline):")
+                print(f"  Best Time: {best_times[baseline, i, j]:.6f}s")
                 
-                # Calculate improvement
-                time_improvement = (np.mean(det_times) - np.mean(rand_times)) / np.mean(det_times) * 100
-                comp_improvement = (np.mean(det_comps) - np.mean(rand_comps)) / np.mean(det_comps) * 100
+                # Calculate speedup (> 1 means randomized is faster)
+                time_speedup = speedup_ratio(best_times[deterministic, i, j], best_times[randomized, i, j])
+                comp_speedup = speedup_ratio(means[deterministic, i, j, comparisons],
+                                             means[randomized, i, j, comparisons])
                 
                 print(f"Randomized vs Deterministic:")
-                print(f"  Time Improvement: {time_improvement:.2f}%")
-                print(f"  Comparison Improvement: {comp_improvement:.2f}%")
+                print(f"  Time Speedup: {time_speedup:.2f}x")
+                print(f"  Comparison Ratio: {comp_speedup:.2f}x")
 
 
 def main():
@@ -277,14 +660,14 @@ def main():
         print(f"\n{description}: {test_array}")
         
         # Test randomized quicksort
-        rand_arr = test_array.copy()
+        rand_arr = np.array(test_array, dtype=np.int64)
         analyzer.randomized_quicksort(rand_arr)
-        print(f"Randomized Quicksort: {rand_arr}")
+        print(f"Randomized Quicksort: {rand_arr.tolist()}")
         
         # Test deterministic quicksort
-        det_arr = test_array.copy()
+        det_arr = np.array(test_array, dtype=np.int64)
         analyzer.deterministic_quicksort(det_arr)
-        print(f"Deterministic Quicksort: {det_arr}")
+        print(f"Deterministic Quicksort: {det_arr.tolist()}")
     
     # Performance comparison
     print("\n" + "=" * 50)